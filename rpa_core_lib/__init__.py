@@ -1,11 +1,20 @@
 """RPA Core Library - Ferramentas para automação web com Selenium"""
 
+import importlib
+
 __version__ = '0.1.0'
 __author__ = 'Bruno Oliveira Marques'
 
-from .browser import open_chrome, BrowserManager
-from .logger import RPALogger, LoggerFactory, get_rpa_logger
-from .data import DataHandler
+# Submódulos são importados sob demanda (PEP 562): quem usa apenas o
+# DataHandler não paga a importação do Selenium, e vice-versa.
+_LAZY = {
+    'open_chrome': 'browser',
+    'BrowserManager': 'browser',
+    'RPALogger': 'logger',
+    'LoggerFactory': 'logger',
+    'get_rpa_logger': 'logger',
+    'DataHandler': 'data',
+}
 
 __all__ = [
     'open_chrome',
@@ -15,3 +24,16 @@ __all__ = [
     'get_rpa_logger',
     'DataHandler',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,21 +3,146 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
+from collections import OrderedDict
+import functools
+import json
 import logging
+import threading
+import urllib.request
+
+try:
+    # websocket-client é opcional: sem ele os comandos CDP passam pelo ChromeDriver
+    import websocket
+except ImportError:
+    websocket = None
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _driver_path():
+    """Resolve o caminho do ChromeDriver uma única vez por processo."""
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=8)
+def _chrome_arguments(headless, window_size, user_agent, rpa_args, additional_args):
+    """Monta os argumentos do Chrome, cacheados por configuração."""
+    arguments = []
+    
+    # Modo headless
+    if headless:
+        arguments.append('--headless')
+    
+    # Tamanho da janela
+    arguments.append(f'--window-size={window_size[0]},{window_size[1]}')
+    
+    # User Agent customizado para evitar detecção de bot
+    if user_agent:
+        arguments.append(f'user-agent={user_agent}')
+    else:
+        # User Agent padrão que parece mais legítimo
+        default_ua = (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) '
+            'Chrome/120.0.0.0 Safari/537.36'
+        )
+        arguments.append(f'user-agent={default_ua}')
+    
+    # Argumentos recomendados para RPA e argumentos adicionais do usuário
+    arguments.extend(rpa_args)
+    arguments.extend(additional_args)
+    
+    return tuple(arguments)
+
+
+@functools.lru_cache(maxsize=256)
+def _presence(locator):
+    """Condição de presença reutilizada para o mesmo localizador."""
+    return EC.presence_of_element_located(locator)
+
+
+@functools.lru_cache(maxsize=256)
+def _clickable(locator):
+    """Condição de clicabilidade reutilizada para o mesmo localizador."""
+    return EC.element_to_be_clickable(locator)
+
+
+class _CDPConnectionError(WebDriverException):
+    """Falha na conexão WebSocket com o DevTools (aba fechada, socket caído)."""
+
+
+class _CDPSession:
+    """Conexão WebSocket persistente com o DevTools de uma aba do Chrome."""
+
+    def __init__(self, ws_url, timeout):
+        self._ws = websocket.create_connection(
+            ws_url, timeout=timeout, suppress_origin=True
+        )
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def send(self, method, params=None):
+        """Envia um comando e aguarda a resposta com o mesmo id."""
+        with self._lock:
+            self._next_id += 1
+            message_id = self._next_id
+            try:
+                self._ws.send(json.dumps({
+                    'id': message_id,
+                    'method': method,
+                    'params': params or {},
+                }))
+                # Eventos recebidos enquanto aguardamos a resposta são descartados
+                while True:
+                    message = json.loads(self._ws.recv())
+                    if message.get('id') == message_id:
+                        break
+            except (websocket.WebSocketException, OSError) as e:
+                raise _CDPConnectionError(f"Conexão CDP perdida em {method}: {str(e)}") from e
+
+        if 'error' in message:
+            raise WebDriverException(
+                f"Erro CDP em {method}: {message['error'].get('message')}"
+            )
+        return message.get('result', {})
+
+    def close(self):
+        """Fecha a conexão WebSocket."""
+        self._ws.close()
+
+
+class _AttachedRemote(webdriver.Remote):
+    """WebDriver remoto que reutiliza uma sessão existente sem criar outra."""
+
+    def __init__(self, command_executor, session_id, options):
+        self._attach_session_id = session_id
+        super().__init__(command_executor=command_executor, options=options)
+
+    def start_session(self, capabilities, *args, **kwargs):
+        """Associa a sessão existente em vez de iniciar uma nova."""
+        self.session_id = self._attach_session_id
+        self.caps = {}
+
+
 class BrowserManager:
     """Gerenciador de navegador Chrome para automação RPA."""
     
     DEFAULT_WAIT_TIME = 10  # segundos
     DEFAULT_WINDOW_SIZE = (1920, 1080)
+    ELEMENT_CACHE_SIZE = 128  # elementos mantidos no cache LRU
+    DEFAULT_POOL_SIZE = 20  # conexões HTTP simultâneas com o ChromeDriver
     
     # Argumentos recomendados para RPA
     RPA_ARGS = [
@@ -31,7 +156,8 @@ class BrowserManager:
     ]
     
     def __init__(self, headless=True, window_size=None, additional_args=None, 
-                 wait_time=DEFAULT_WAIT_TIME, user_agent=None):
+                 wait_time=DEFAULT_WAIT_TIME, user_agent=None,
+                 pool_size=DEFAULT_POOL_SIZE):
         """
         Inicializa o gerenciador de navegador Chrome.
 
@@ -42,6 +168,8 @@ class BrowserManager:
             additional_args (list): Argumentos adicionais para o Chrome
             wait_time (int): Tempo padrão de espera para elementos (segundos)
             user_agent (str): User Agent customizado para evitar detecção de bot
+            pool_size (int): Tamanho do pool de conexões HTTP com o ChromeDriver.
+                           Padrão: 20
 
         Exemplo:
             >>> manager = BrowserManager(headless=True)
@@ -53,40 +181,80 @@ class BrowserManager:
         self.wait_time = wait_time
         self.additional_args = additional_args or []
         self.user_agent = user_agent
+        self.pool_size = pool_size
         self.driver = None
         self.wait = None
+        self._cdp = None
+        self._cdp_handle = None  # janela à qual a conexão CDP direta pertence
+        self._el_cache = OrderedDict()
+        self._wait_cache = {}
+        self._root_node_id = None
+        self._executor_url = None
+        self._pinned = []
+    
+    @classmethod
+    def attach(cls, executor_url, session_id, **kwargs):
+        """
+        Conecta a uma sessão do Chrome já em execução.
+
+        Evita o cold-start do navegador e o download do ChromeDriver,
+        útil para reexecuções e recuperação após falhas do script.
+
+        Args:
+            executor_url (str): URL do ChromeDriver (command_executor_url)
+            session_id (str): ID da sessão existente (session_id)
+            **kwargs: Argumentos adicionais para BrowserManager
+
+        Returns:
+            BrowserManager: Gerenciador associado à sessão existente
+
+        Exemplo:
+            >>> manager = BrowserManager.attach(
+            ...     'http://127.0.0.1:9515', 'a1b2c3d4e5f6')
+            >>> manager.navigate('https://example.com')
+        """
+        manager = cls(**kwargs)
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=executor_url,
+            vendor_prefix='goog',
+            browser_name='chrome',
+            keep_alive=True
+        )
+        
+        try:
+            manager.driver = _AttachedRemote(executor, session_id, Options())
+            manager.wait = WebDriverWait(manager.driver, manager.wait_time)
+            manager._executor_url = executor_url
+            manager._resize_connection_pool()
+            manager._install_pinned_scripts()
+            logger.info(f"Conectado à sessão existente {session_id}")
+        except Exception as e:
+            logger.error(f"Erro ao conectar à sessão {session_id}: {str(e)}")
+            raise
+        
+        return manager
+    
+    @property
+    def session_id(self):
+        """ID da sessão WebDriver atual, ou None se não houver driver."""
+        return self.driver.session_id if self.driver else None
+    
+    @property
+    def command_executor_url(self):
+        """URL do ChromeDriver que atende a sessão atual."""
+        return self._executor_url if self.driver else None
     
     def _configure_options(self):
         """Configura as opções do Chrome."""
         chrome_options = Options()
-        
-        # Modo headless
-        if self.headless:
-            chrome_options.add_argument('--headless')
-        
-        # Tamanho da janela
-        chrome_options.add_argument(
-            f'--window-size={self.window_size[0]},{self.window_size[1]}'
+        arguments = _chrome_arguments(
+            self.headless,
+            tuple(self.window_size),
+            self.user_agent,
+            tuple(self.RPA_ARGS),
+            tuple(self.additional_args),
         )
-        
-        # User Agent customizado para evitar detecção de bot
-        if self.user_agent:
-            chrome_options.add_argument(f'user-agent={self.user_agent}')
-        else:
-            # User Agent padrão que parece mais legítimo
-            default_ua = (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/120.0.0.0 Safari/537.36'
-            )
-            chrome_options.add_argument(f'user-agent={default_ua}')
-        
-        # Adicionar argumentos recomendados para RPA
-        for arg in self.RPA_ARGS:
-            chrome_options.add_argument(arg)
-        
-        # Argumentos adicionais do usuário
-        for arg in self.additional_args:
+        for arg in arguments:
             chrome_options.add_argument(arg)
         
         return chrome_options
@@ -103,24 +271,207 @@ class BrowserManager:
             
             try:
                 self.driver = webdriver.Chrome(
-                    service=Service(ChromeDriverManager().install()),
+                    service=Service(_driver_path()),
                     options=chrome_options
                 )
                 self.wait = WebDriverWait(self.driver, self.wait_time)
+                self._executor_url = self.driver.service.service_url
+                self._resize_connection_pool()
                 logger.info("Driver Chrome inicializado com sucesso")
             except Exception as e:
                 logger.error(f"Erro ao inicializar driver Chrome: {str(e)}")
                 raise
+            
+            self._cdp = self._open_cdp_session()
+            self._install_pinned_scripts()
         
         return self.driver
     
+    def _resize_connection_pool(self):
+        """
+        Amplia o pool de conexões HTTP entre o Selenium e o ChromeDriver.
+
+        O pool padrão do urllib3 mantém uma única conexão por host, o que
+        serializa comandos enviados por threads diferentes.
+        """
+        pool_manager = getattr(self.driver.command_executor, '_conn', None)
+        if pool_manager is None:
+            return
+        
+        pool_manager.connection_pool_kw['maxsize'] = self.pool_size
+        # Descarta o pool já criado para que o próximo use o novo tamanho
+        pool_manager.clear()
+    
+    def _open_cdp_session(self):
+        """
+        Abre uma conexão CDP direta com a aba atual do Chrome.
+
+        O endereço do DevTools é informado pelo ChromeDriver nas capabilities.
+        Retorna None (comandos seguem pelo ChromeDriver) se websocket-client
+        não estiver instalado ou se a conexão falhar.
+        """
+        if websocket is None:
+            return None
+        
+        chrome_caps = self.driver.capabilities.get('goog:chromeOptions', {})
+        address = chrome_caps.get('debuggerAddress')
+        if not address:
+            return None
+        
+        try:
+            with urllib.request.urlopen(f'http://{address}/json',
+                                        timeout=self.wait_time) as response:
+                targets = json.load(response)
+            
+            handle = self.driver.current_window_handle.replace('CDwindow-', '')
+            pages = [t for t in targets if t.get('type') == 'page']
+            target = next((t for t in pages if t.get('id') == handle), None)
+            if target is None and len(pages) == 1:
+                target = pages[0]
+            if target is None:
+                return None
+            
+            session = _CDPSession(target['webSocketDebuggerUrl'], self.wait_time)
+            self._cdp_handle = self.driver.current_window_handle
+            logger.info("Conexão CDP direta estabelecida")
+            return session
+        except Exception as e:
+            logger.warning(f"CDP direto indisponível, usando ChromeDriver: {str(e)}")
+            return None
+    
+    def cdp(self, method, params=None):
+        """
+        Executa um comando do Chrome DevTools Protocol.
+
+        Usa a conexão WebSocket direta quando disponível, evitando o
+        round-trip HTTP ao ChromeDriver; caso contrário envia o comando
+        pelo ChromeDriver (executeCdpCommand). Em ambos os casos o comando
+        vai para a janela atual do WebDriver (switch_to.window).
+
+        Args:
+            method (str): Método CDP (ex: 'Page.reload')
+            params (dict): Parâmetros do método
+
+        Returns:
+            dict: Resultado do comando
+
+        Exemplo:
+            >>> manager.cdp('Network.clearBrowserCache')
+        """
+        self._sync_cdp_session()
+        return self._send_cdp(method, params)
+    
+    def _sync_cdp_session(self):
+        """
+        Mantém a conexão CDP direta na janela atual do WebDriver.
+
+        Após um switch_to.window a conexão é reaberta na nova aba; se isso
+        falhar, os comandos passam a ir pelo ChromeDriver.
+        """
+        if self._cdp is None:
+            return
+        
+        handle = self.driver.current_window_handle
+        if handle == self._cdp_handle:
+            return
+        
+        self._close_cdp_session()
+        self._root_node_id = None
+        self._cdp = self._open_cdp_session()
+    
+    def _send_cdp(self, method, params=None):
+        """Envia um comando CDP sem verificar a janela atual."""
+        if self._cdp is not None:
+            try:
+                return self._cdp.send(method, params)
+            except _CDPConnectionError as e:
+                # Aba fechada ou conexão perdida: seguir pelo ChromeDriver
+                logger.warning(f"Conexão CDP direta perdida, usando ChromeDriver: {str(e)}")
+                self._close_cdp_session()
+        
+        response = self.driver.execute(
+            'executeCdpCommand', {'cmd': method, 'params': params or {}}
+        )
+        return response['value']
+    
+    def _close_cdp_session(self):
+        """Fecha a conexão CDP direta, se houver."""
+        if self._cdp is not None:
+            try:
+                self._cdp.close()
+            except Exception as e:
+                logger.warning(f"Erro ao fechar conexão CDP: {str(e)}")
+            self._cdp = None
+        self._cdp_handle = None
+    
+    def evaluate(self, expression):
+        """
+        Avalia uma expressão JavaScript via CDP e retorna o valor.
+
+        Combinado com pin_script, permite chamar funções auxiliares já
+        compiladas na página em vez de reenviar o código com execute_script.
+
+        Args:
+            expression (str): Expressão JavaScript
+
+        Returns:
+            any: Valor da expressão (serializado como JSON)
+
+        Exemplo:
+            >>> title = manager.evaluate('document.title')
+        """
+        result = self.cdp('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+        })
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            message = details.get('exception', {}).get('description', details.get('text'))
+            raise WebDriverException(f"Erro ao avaliar JavaScript: {message}")
+        return result['result'].get('value')
+    
+    def pin_script(self, source):
+        """
+        Registra um script para ser executado em todo novo documento.
+
+        O script é instalado via Page.addScriptToEvaluateOnNewDocument, então
+        funções auxiliares ficam disponíveis após cada navegação sem serem
+        reenviadas. Também é aplicado imediatamente à página atual.
+
+        Args:
+            source (str): Código JavaScript
+
+        Exemplo:
+            >>> manager.pin_script('window.__rpa_count = s => document.querySelectorAll(s).length')
+            >>> manager.evaluate("__rpa_count('tr')")
+        """
+        self._pinned.append(source)
+        if self.driver is not None:
+            self._install_script(source)
+    
+    def _install_pinned_scripts(self):
+        """Instala no navegador os scripts registrados antes do driver subir."""
+        for source in self._pinned:
+            self._install_script(source)
+    
+    def _install_script(self, source):
+        """Instala um script para novos documentos e o executa na página atual."""
+        self.cdp('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+        self.cdp('Runtime.evaluate', {'expression': source})
+    
     def close_driver(self):
         """Fecha o driver Chrome."""
+        self._close_cdp_session()
+        
         if self.driver:
             try:
                 self.driver.quit()
                 self.driver = None
                 self.wait = None
+                self._executor_url = None
+                self._el_cache.clear()
+                self._wait_cache.clear()
+                self._root_node_id = None
                 logger.info("Driver Chrome fechado com sucesso")
             except Exception as e:
                 logger.error(f"Erro ao fechar driver: {str(e)}")
@@ -140,14 +491,18 @@ class BrowserManager:
         Exemplo:
             >>> element = manager.wait_element((By.ID, 'myElement'))
         """
-        timeout = timeout or self.wait_time
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        locator = tuple(locator)
+        return self._get_wait(timeout).until(_presence(locator))
     
     def wait_element_clickable(self, locator, timeout=None):
         """
         Aguarda um elemento estar clicável.
 
+        O elemento fica em cache até a próxima navegação. Se a página alterar
+        o DOM sem navegar (ex: reordenação via AJAX), chame
+        clear_element_cache() para não reutilizar um elemento que não
+        corresponde mais ao locator.
+
         Args:
             locator (tuple): Tupla (By.*, valor) do elemento
             timeout (int): Tempo máximo de espera em segundos
@@ -155,9 +510,66 @@ class BrowserManager:
         Returns:
             WebElement: O elemento quando clicável
         """
+        locator = tuple(locator)
+        element = self._get_cached_element(locator)
+        if element is None:
+            wait = self._get_wait(timeout)
+            element = wait.until(_clickable(locator))
+            self._cache_element(locator, element)
+        return element
+    
+    def clear_element_cache(self):
+        """
+        Descarta os elementos guardados por wait_element_clickable.
+
+        Exemplo:
+            >>> manager.fast_click('#ordenar')
+            >>> manager.clear_element_cache()
+        """
+        self._el_cache.clear()
+    
+    def _get_wait(self, timeout):
+        """Retorna o WebDriverWait do timeout, reutilizando instâncias já criadas."""
         timeout = timeout or self.wait_time
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        if timeout == self.wait_time and self.wait is not None:
+            return self.wait
+        
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout)
+            self._wait_cache[timeout] = wait
+        return wait
+    
+    def _get_cached_element(self, key):
+        """
+        Retorna o elemento em cache se ainda estiver anexado e clicável.
+
+        Elementos obsoletos (stale), desabilitados ou ocultos são descartados
+        do cache.
+        """
+        element = self._el_cache.get(key)
+        if element is None:
+            return None
+        
+        try:
+            # is_enabled falha se o elemento for stale
+            valid = element.is_enabled() and element.is_displayed()
+        except StaleElementReferenceException:
+            valid = False
+        
+        if not valid:
+            del self._el_cache[key]
+            return None
+        
+        self._el_cache.move_to_end(key)
+        return element
+    
+    def _cache_element(self, key, element):
+        """Adiciona um elemento ao cache, descartando o menos usado."""
+        self._el_cache[key] = element
+        self._el_cache.move_to_end(key)
+        if len(self._el_cache) > self.ELEMENT_CACHE_SIZE:
+            self._el_cache.popitem(last=False)
     
     def navigate(self, url):
         """
@@ -166,6 +578,8 @@ class BrowserManager:
         Args:
             url (str): URL para navegar
         """
+        self._el_cache.clear()
+        self._root_node_id = None
         try:
             self.driver.get(url)
             logger.info(f"Navegado para {url}")
@@ -173,6 +587,57 @@ class BrowserManager:
             logger.error(f"Erro ao navegar para {url}: {str(e)}")
             raise
     
+    def fast_click(self, selector):
+        """
+        Clica em um elemento via eventos de mouse do CDP.
+
+        Evita o ciclo find_element/click do WebDriver: o elemento é
+        localizado com DOM.querySelector e clicado com Input.dispatchMouseEvent
+        no centro da sua caixa.
+
+        Args:
+            selector (str): Seletor CSS do elemento
+
+        Exemplo:
+            >>> manager.fast_click('button.submit')
+        """
+        self._sync_cdp_session()
+        try:
+            node_id = self._query_selector(selector)
+        except WebDriverException:
+            # A página pode ter navegado sozinha: renova o nó raiz e tenta de novo
+            self._root_node_id = None
+            node_id = self._query_selector(selector)
+        
+        if not node_id:
+            raise NoSuchElementException(f"Elemento não encontrado: {selector}")
+        
+        self._send_cdp('DOM.scrollIntoViewIfNeeded', {'nodeId': node_id})
+        quad = self._send_cdp('DOM.getBoxModel', {'nodeId': node_id})['model']['content']
+        x = sum(quad[0::2]) / 4
+        y = sum(quad[1::2]) / 4
+        
+        for event_type in ('mousePressed', 'mouseReleased'):
+            self._send_cdp('Input.dispatchMouseEvent', {
+                'type': event_type,
+                'x': x,
+                'y': y,
+                'button': 'left',
+                'clickCount': 1,
+            })
+    
+    def _query_selector(self, selector):
+        """Retorna o nodeId CDP do primeiro elemento do seletor (0 se ausente)."""
+        if self._root_node_id is None:
+            document = self._send_cdp('DOM.getDocument', {'depth': 0})
+            self._root_node_id = document['root']['nodeId']
+        
+        result = self._send_cdp('DOM.querySelector', {
+            'nodeId': self._root_node_id,
+            'selector': selector,
+        })
+        return result['nodeId']
+    
     def get_current_url(self):
         """Retorna a URL atual."""
         return self.driver.current_url
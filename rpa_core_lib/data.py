@@ -1,12 +1,41 @@
 """Módulo de utilitários para manipulação de dados com Pandas em projetos RPA"""
 
 import pandas as pd
+import importlib.util
+import logging
 import os
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Union, List, Dict, Optional, Any
 
 
+logger = logging.getLogger(__name__)
+
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+
+# Engines opcionais mais rápidos, usados apenas se estiverem instalados
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+# Opções de pd.read_csv que o engine pyarrow não suporta
+_PYARROW_CSV_UNSUPPORTED = frozenset({
+    'chunksize', 'iterator', 'nrows', 'skipfooter', 'comment', 'thousands',
+    'converters', 'dialect', 'quoting', 'lineterminator', 'delim_whitespace',
+    'skipinitialspace', 'float_precision', 'memory_map', 'low_memory',
+    'dayfirst', 'on_bad_lines',
+})
+
+
+def _copy_on_write_active() -> bool:
+    """Indica se o pandas usa Copy-on-Write (padrão no 3.0, opcional antes)."""
+    if _PANDAS_VERSION >= (3, 0):
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except (KeyError, AttributeError):  # opção inexistente antes do pandas 1.5
+        return False
+
+
 class DataHandler:
     """Gerenciador de dados para projetos RPA com suporte a múltiplos formatos."""
     
@@ -14,6 +43,15 @@ class DataHandler:
     DEFAULT_ENCODING = 'utf-8'
     DEFAULT_OUTPUT_DIR = 'dados_exportados'
     
+    # Formato -> método de escrita usado por save_with_timestamp
+    _SAVE_DISPATCH = {
+        'csv': 'save_csv',
+        'xlsx': 'save_excel',
+        'json': 'save_json',
+        'parquet': 'save_parquet',
+        'html': 'save_html',
+    }
+    
     def __init__(self, output_dir=None, encoding=None):
         """
         Inicializa o gerenciador de dados.
@@ -38,12 +76,17 @@ class DataHandler:
     
     # ==================== LEITURA DE DADOS ====================
     
-    def read_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def read_csv(self, file_path: str, fast=False, **kwargs) -> pd.DataFrame:
         """
         Lê arquivo CSV.
 
         Args:
             file_path (str): Caminho do arquivo CSV
+            fast (bool): Ler com o engine multi-thread do pyarrow. Os tipos
+                        retornados diferem do parser padrão (datas ISO como
+                        datetime.date, None em vez de NaN em colunas texto).
+                        Ignorado se pyarrow não estiver instalado ou se
+                        houver opções não suportadas por ele. Padrão: False
             **kwargs: Argumentos adicionais para pd.read_csv()
 
         Returns:
@@ -51,8 +94,17 @@ class DataHandler:
 
         Exemplo:
             >>> df = handler.read_csv('dados.csv', sep=';')
+            >>> df = handler.read_csv('grande.csv', fast=True)
         """
         kwargs.setdefault('encoding', self.encoding)
+        
+        if fast and 'engine' not in kwargs and self._can_use_pyarrow_csv(file_path, kwargs):
+            try:
+                return pd.read_csv(file_path, engine='pyarrow', **kwargs)
+            except ValueError:
+                # Opção ou conteúdo não suportado pelo pyarrow: usar parser padrão
+                pass
+        
         return pd.read_csv(file_path, **kwargs)
     
     def read_excel(self, file_path: str, sheet_name=0, **kwargs) -> pd.DataFrame:
@@ -67,9 +119,16 @@ class DataHandler:
         Returns:
             pd.DataFrame: DataFrame com os dados
 
+        Arquivos .xlsx/.xlsm são lidos com engine='calamine' quando o
+        python-calamine está instalado (pandas 2.2+).
+
         Exemplo:
             >>> df = handler.read_excel('dados.xlsx', sheet_name='Sheet1')
         """
+        if ('engine' not in kwargs and _HAS_CALAMINE and _PANDAS_VERSION >= (2, 2)
+                and str(file_path).lower().endswith(('.xlsx', '.xlsm'))):
+            kwargs['engine'] = 'calamine'
+        
         return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
     
     def read_json(self, file_path: str, **kwargs) -> pd.DataFrame:
@@ -117,7 +176,8 @@ class DataHandler:
     
     # ==================== ESCRITA DE DADOS ====================
     
-    def save_csv(self, df: pd.DataFrame, filename: str, index=False, **kwargs) -> str:
+    def save_csv(self, df: pd.DataFrame, filename: str, index=False,
+                 fast=False, **kwargs) -> str:
         """
         Salva DataFrame em CSV.
 
@@ -125,6 +185,11 @@ class DataHandler:
             df (pd.DataFrame): DataFrame para salvar
             filename (str): Nome do arquivo (com ou sem extensão)
             index (bool): Salvar índice. Padrão: False
+            fast (bool): Escrever com o writer multi-thread do pyarrow.
+                        A formatação difere do pandas (strings entre aspas,
+                        booleanos em minúsculas). Ignorado se pyarrow não
+                        estiver instalado, se index=True, se houver kwargs
+                        ou se a codificação não for UTF-8. Padrão: False
             **kwargs: Argumentos adicionais para df.to_csv()
 
         Returns:
@@ -132,9 +197,23 @@ class DataHandler:
 
         Exemplo:
             >>> path = handler.save_csv(df, 'saida.csv')
+            >>> path = handler.save_csv(df_grande, 'saida.csv', fast=True)
         """
         filename = self._add_extension(filename, 'csv')
         file_path = os.path.join(self.output_dir, filename)
+        
+        if fast and self._can_use_pyarrow_writer(index, kwargs):
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(table, file_path)
+                return file_path
+            except (ValueError, TypeError, NotImplementedError) as e:
+                # Tipos que o Arrow não converte: usar o writer do pandas
+                logger.warning(f"Escrita via pyarrow indisponível: {e}")
+        
         df.to_csv(file_path, index=index, encoding=self.encoding, **kwargs)
         return file_path
     
@@ -238,14 +317,10 @@ class DataHandler:
         Exemplo:
             >>> df = handler.clean_columns(df)
         """
-        df = df.copy()
-        
-        if lowercase:
-            df.columns = df.columns.str.lower()
-        
-        if remove_spaces:
-            df.columns = df.columns.str.replace(' ', '_')
-        
+        # Com Copy-on-Write a cópia rasa basta: os dados só são copiados se o
+        # resultado for alterado. Sem ele, a cópia precisa ser profunda.
+        df = df.copy(deep=not _copy_on_write_active())
+        df.columns = self._clean_column_names(df.columns, lowercase, remove_spaces)
         return df
     
     def remove_duplicates(self, df: pd.DataFrame, subset=None, 
@@ -274,7 +349,7 @@ class DataHandler:
 
         Args:
             df (pd.DataFrame): DataFrame para processar
-            method (str): 'forward', 'backward' ou None
+            method (str): 'forward' ('ffill'), 'backward' ('bfill') ou None
             fill_value (any): Valor para preenchimento
 
         Returns:
@@ -283,16 +358,14 @@ class DataHandler:
         Exemplo:
             >>> df = handler.fill_missing(df, fill_value=0)
         """
-        df = df.copy()
-        
         if fill_value is not None:
-            df = df.fillna(fill_value)
-        elif method == 'forward':
-            df = df.fillna(method='ffill')
-        elif method == 'backward':
-            df = df.fillna(method='bfill')
-        
-        return df
+            return df.fillna(fill_value)
+        if method in ('forward', 'ffill'):
+            return df.ffill()
+        if method in ('backward', 'bfill'):
+            return df.bfill()
+        # Nada a preencher: ainda assim devolver uma cópia independente da entrada
+        return df.copy(deep=not _copy_on_write_active())
     
     def rename_columns(self, df: pd.DataFrame, mapping: Dict[str, str]) -> pd.DataFrame:
         """
@@ -331,7 +404,7 @@ class DataHandler:
         Args:
             df (pd.DataFrame): DataFrame para processar
             column (str): Nome da coluna
-            values (list|any): Valor(es) para manter
+            values (list|set|any): Valor(es) para manter
 
         Returns:
             pd.DataFrame: DataFrame filtrado
@@ -339,7 +412,7 @@ class DataHandler:
         Example:
             >>> df = handler.filter_rows(df, 'status', ['ativo', 'pendente'])
         """
-        if isinstance(values, (list, tuple)):
+        if isinstance(values, (list, tuple, set, frozenset)):
             return df[df[column].isin(values)]
         return df[df[column] == values]
     
@@ -357,25 +430,36 @@ class DataHandler:
         Exemplo:
             >>> df = handler.convert_dtype(df, {'idade': 'int', 'data': 'datetime64'})
         """
-        df = df.copy()
+        valid = {column: dtype for column, dtype in dtype_mapping.items()
+                 if column in df.columns}
+        
+        # Caminho rápido: todas as colunas convertidas em um único astype
+        try:
+            return df.astype(valid)
+        except Exception:
+            pass
         
-        for column, dtype in dtype_mapping.items():
-            if column in df.columns:
-                try:
-                    df[column] = df[column].astype(dtype)
-                except Exception as e:
-                    print(f"Erro ao converter {column}: {e}")
+        # Alguma conversão falhou: converte coluna a coluna para isolar o erro
+        df = df.copy()
+        for column, dtype in valid.items():
+            try:
+                df[column] = df[column].astype(dtype)
+            except Exception as e:
+                logger.warning(f"Erro ao converter {column}: {e}")
         
         return df
     
     # ==================== ANÁLISE ====================
     
-    def get_info(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def get_info(self, df: pd.DataFrame, deep: bool = False) -> Dict[str, Any]:
         """
         Retorna informações sobre o DataFrame.
 
         Args:
             df (pd.DataFrame): DataFrame para analisar
+            deep (bool): Medir a memória real de colunas de objetos (strings).
+                        Mais preciso, porém percorre cada célula; o padrão
+                        é uma estimativa rápida por coluna. Padrão: False
 
         Returns:
             dict: Dicionário com informações
@@ -389,7 +473,7 @@ class DataHandler:
             'dtypes': df.dtypes.to_dict(),
             'missing': df.isnull().sum().to_dict(),
             'duplicates': df.duplicated().sum(),
-            'memory_usage': df.memory_usage(deep=True).sum()
+            'memory_usage': df.memory_usage(deep=deep).sum()
         }
     
     def get_summary(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -414,15 +498,53 @@ class DataHandler:
         Returns:
             pd.DataFrame: Informações de valores faltantes
         """
+        # Uma única varredura de nulos, reaproveitada para contagem e percentual
+        missing_counts = df.isnull().sum().values
+        scale = 100.0 / len(df) if len(df) else 0.0
         missing = pd.DataFrame({
             'coluna': df.columns,
-            'faltantes': df.isnull().sum().values,
-            'percentual': (df.isnull().sum().values / len(df) * 100).round(2)
+            'faltantes': missing_counts,
+            'percentual': (missing_counts * scale).round(2)
         })
         return missing[missing['faltantes'] > 0].sort_values('percentual', ascending=False)
     
     # ==================== UTILITÁRIOS ====================
     
+    def _can_use_pyarrow_csv(self, file_path, kwargs: Dict[str, Any]) -> bool:
+        """Verifica se a leitura de CSV pode usar o engine pyarrow."""
+        if not _HAS_PYARROW or _PANDAS_VERSION < (2, 0):
+            return False
+        
+        # Buffers não podem ser relidos caso seja preciso voltar ao parser padrão
+        if not isinstance(file_path, (str, os.PathLike)):
+            return False
+        
+        if _PYARROW_CSV_UNSUPPORTED.intersection(kwargs):
+            return False
+        
+        # pyarrow aceita apenas separadores de um caractere (sem regex)
+        sep = kwargs.get('sep', kwargs.get('delimiter', ','))
+        return isinstance(sep, str) and len(sep) == 1
+    
+    def _can_use_pyarrow_writer(self, index: bool, kwargs: Dict[str, Any]) -> bool:
+        """Verifica se a escrita de CSV pode usar o pyarrow."""
+        # O writer do pyarrow só grava UTF-8 e não aceita opções do to_csv
+        encoding = self.encoding.lower().replace('-', '').replace('_', '')
+        return _HAS_PYARROW and not index and not kwargs and encoding == 'utf8'
+    
+    def _clean_column_names(self, columns, lowercase=True,
+                            remove_spaces=True) -> List[Any]:
+        """Normaliza nomes de colunas em uma única passada (não-strings são mantidos)."""
+        cleaned = []
+        for column in columns:
+            if isinstance(column, str):
+                if lowercase:
+                    column = column.lower()
+                if remove_spaces:
+                    column = column.replace(' ', '_')
+            cleaned.append(column)
+        return cleaned
+    
     def _add_extension(self, filename: str, extension: str) -> str:
         """Adiciona extensão se não existir."""
         if not filename.endswith(f'.{extension}'):
@@ -441,13 +563,62 @@ class DataHandler:
 
         Returns:
             pd.DataFrame: DataFrame mesclado
+
+        Em merges 'inner' por chave explícita e sem colunas repetidas entre
+        os DataFrames, chaves únicas são alinhadas de uma só vez pelo índice
+        (pd.concat). Com chaves repetidas, os DataFrames menores são mesclados
+        primeiro; nesse caso a ordem das linhas pode diferir da ordem original.
+        """
+        keys = [on] if isinstance(on, str) else list(on or [])
+        columns = None
+        if how == 'inner' and keys and len(df_list) > 1:
+            columns = self._merge_columns(df_list, keys)
+        
+        if columns is None:
+            result = df_list[0]
+            for df in df_list[1:]:
+                result = pd.merge(result, df, how=how, on=on)
+            return result
+        
+        if not any(df.duplicated(subset=keys).any() for df in df_list):
+            indexed = [df.set_index(keys) for df in df_list]
+            result = pd.concat(indexed, axis=1, join='inner').reset_index()
+        else:
+            ordered = sorted(df_list, key=len)
+            result = ordered[0]
+            for df in ordered[1:]:
+                result = pd.merge(result, df, how=how, on=on)
+        
+        return result[columns]
+    
+    def _merge_columns(self, df_list: List[pd.DataFrame],
+                       keys: List[str]) -> Optional[List[str]]:
+        """
+        Retorna a ordem de colunas do merge sequencial equivalente.
+
+        Retorna None se alguma chave faltar, se os tipos das chaves divergirem
+        ou se houver colunas repetidas fora da chave (que gerariam sufixos).
         """
-        result = df_list[0]
+        first = df_list[0]
+        if not all(key in df.columns for df in df_list for key in keys):
+            return None
+        
+        key_dtypes = first[keys].dtypes.tolist()
+        columns = list(first.columns)
+        seen = set(columns)
         
         for df in df_list[1:]:
-            result = pd.merge(result, df, how=how, on=on)
+            if df[keys].dtypes.tolist() != key_dtypes:
+                return None
+            for column in df.columns:
+                if column in keys:
+                    continue
+                if column in seen:
+                    return None
+                seen.add(column)
+                columns.append(column)
         
-        return result
+        return columns
     
     def concat_dataframes(self, df_list: List[pd.DataFrame], 
                          axis=0, ignore_index=True) -> pd.DataFrame:
@@ -464,6 +635,36 @@ class DataHandler:
         """
         return pd.concat(df_list, axis=axis, ignore_index=ignore_index)
     
+    def pipeline(self, df_list: List[pd.DataFrame], *, clean=True,
+                 out_csv: Optional[str] = None) -> pd.DataFrame:
+        """
+        Concatena, limpa colunas e opcionalmente salva em CSV em uma etapa.
+
+        Equivale a concat_dataframes + clean_columns + save_csv, mas os nomes
+        das colunas são ajustados direto no resultado do concat, sem criar
+        DataFrames intermediários.
+
+        Args:
+            df_list (list): Lista de DataFrames
+            clean (bool): Limpar nomes das colunas. Padrão: True
+            out_csv (str): Nome do arquivo CSV de saída. Padrão: None
+
+        Returns:
+            pd.DataFrame: DataFrame resultante
+
+        Exemplo:
+            >>> df = handler.pipeline([df1, df2], out_csv='consolidado')
+        """
+        df = pd.concat(df_list, axis=0, ignore_index=True)
+        
+        if clean:
+            df.columns = self._clean_column_names(df.columns)
+        
+        if out_csv:
+            self.save_csv(df, out_csv)
+        
+        return df
+    
     def save_with_timestamp(self, df: pd.DataFrame, filename: str, 
                            format='csv', **kwargs) -> str:
         """
@@ -472,7 +673,7 @@ class DataHandler:
         Args:
             df (pd.DataFrame): DataFrame para salvar
             filename (str): Nome do arquivo (sem extensão)
-            format (str): Formato ('csv', 'xlsx', 'json', 'parquet')
+            format (str): Formato ('csv', 'xlsx', 'json', 'parquet', 'html')
             **kwargs: Argumentos adicionais
 
         Returns:
@@ -482,8 +683,15 @@ class DataHandler:
             >>> path = handler.save_with_timestamp(df, 'dados', format='csv')
             >>> # Salva como 'dados_20260128_143025.csv'
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        method_name = self._SAVE_DISPATCH.get(format)
+        if method_name is None:
+            raise ValueError(
+                f"Formato não suportado: {format!r}. "
+                f"Use um de: {', '.join(self._SAVE_DISPATCH)}"
+            )
+        
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         filename_with_ts = f'{filename}_{timestamp}'
         
-        save_method = getattr(self, f'save_{format}')
+        save_method = getattr(self, method_name)
         return save_method(df, filename_with_ts, **kwargs)
@@ -1,15 +1,264 @@
 """Módulo de gerenciamento de logs para automação RPA"""
 
+import atexit
+import keyword
 import logging
 import logging.handlers
 import os
+import queue
+import re
+import sys
+import threading
+import time
 from datetime import datetime
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 from pathlib import Path
 
 
+# stacklevel passado a Logger._log pelos métodos de RPALogger para que o
+# registro aponte para quem chamou o método. Antes do Python 3.11 o
+# findCaller já parte do frame acima de _log (o próprio método); a partir do
+# 3.11 ele conta todos os frames fora do módulo logging.
+_STACKLEVEL = 2 if sys.version_info >= (3, 11) else 1
+
+# Data usada no nome dos arquivos de log, calculada uma vez por processo
+_DATE_STAMP = datetime.now().strftime('%Y%m%d')
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter que reaproveita o asctime formatado dentro do mesmo segundo.
+
+    Com datefmt sem frações de segundo, registros do mesmo segundo têm o
+    mesmo asctime; o par (segundo, texto) fica em um único atributo para
+    ser trocado de forma atômica entre as threads de escrita.
+
+    O texto final também fica guardado no próprio registro, de modo que os
+    handlers de console e de arquivo, que compartilham o formatter, formatam
+    cada registro uma única vez. O cache guarda id(self), e não o próprio
+    formatter, para que o registro continue serializável com pickle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time = (None, None)
+
+    def format(self, record):
+        cached = record.__dict__.get('_rpa_formatted')
+        if cached is not None and cached[0] == id(self):
+            return cached[1]
+        s = super().format(record)
+        record._rpa_formatted = (id(self), s)
+        return s
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        ct = int(record.created)
+        last_ct, last_str = self._last_time
+        if ct == last_ct:
+            return last_str
+        s = time.strftime(datefmt, self.converter(ct))
+        self._last_time = (ct, s)
+        return s
+
+
+# Campos %(nome)s / %(nome)d e o escape %%, os únicos aceitos por _compile_format
+_FORMAT_FIELD_RE = re.compile(r'%\(([A-Za-z_]\w*)\)([sd])|%%')
+
+
+def _compile_format(fmt):
+    """
+    Gera uma função record -> texto equivalente a fmt % record.__dict__.
+
+    O formato vira uma f-string compilada uma única vez, que lê apenas os
+    atributos usados. Retorna None se houver especificações além de
+    %(nome)s, %(nome)d e %%, ou campos com nome de palavra reservada (como
+    %(class)s), que não podem ser lidos como r.nome.
+    """
+    parts = []
+    pos = 0
+    for match in _FORMAT_FIELD_RE.finditer(fmt):
+        literal = fmt[pos:match.start()]
+        if '%' in literal:
+            return None
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        field, conversion = match.groups()
+        if field is None:
+            parts.append('%')
+        elif keyword.iskeyword(field):
+            return None
+        else:
+            parts.append(f"{{r.{field}{'!s' if conversion == 's' else ':d'}}}")
+        pos = match.end()
+    
+    tail = fmt[pos:]
+    if '%' in tail:
+        return None
+    parts.append(tail.replace('{', '{{').replace('}', '}}'))
+    return eval('lambda r: f' + repr(''.join(parts)), {})
+
+
+class _FastFormatter(_CachedTimeFormatter):
+    """
+    Formatter que monta a linha com uma função gerada a partir do formato.
+
+    Substitui a formatação por % do PercentStyle, que percorre todo o
+    record.__dict__, por uma f-string com os campos do formato. Formatos
+    com especificações não suportadas usam o caminho padrão.
+    """
+
+    def __init__(self, fmt=None, datefmt=None, *args, **kwargs):
+        super().__init__(fmt, datefmt, *args, **kwargs)
+        if type(self._style) is logging.PercentStyle:
+            format_message = _compile_format(self._style._fmt)
+            if format_message is not None:
+                self.formatMessage = format_message
+
+
+# Campos do LogRecord que dependem de findCaller
+_CALLER_FIELDS_RE = re.compile(r'%\((?:pathname|filename|module|lineno|funcName)\)')
+
+
+# Escrita direta no descritor, sem conversão de fim de linha no Windows
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+
+class _BatchedAppendHandler(logging.Handler):
+    """
+    Handler de arquivo com rotação que grava registros em lote.
+
+    Os registros já codificados se acumulam em um bytearray e vão para o
+    arquivo em uma única chamada os.write quando o buffer passa de
+    FLUSH_THRESHOLD bytes, em registros de nível ERROR ou acima e em
+    flush/close. O tamanho do arquivo é acompanhado por um contador, e a
+    rotação segue as mesmas regras do RotatingFileHandler (arquivo.1,
+    arquivo.2, ...), ocorrendo apenas com maxBytes e backupCount maiores
+    que zero.
+    """
+
+    FLUSH_THRESHOLD = 64 * 1024
+    terminator = '\n'
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding='utf-8'):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.encoding = encoding
+        self._buf = bytearray()
+        self._fd = None
+        self._size = 0
+        self._open()
+
+    def _open(self):
+        try:
+            self._fd = os.open(self.baseFilename, _APPEND_FLAGS, 0o644)
+        except FileNotFoundError:
+            # Diretório removido durante a execução: recriar e tentar de novo
+            os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+            self._fd = os.open(self.baseFilename, _APPEND_FLAGS, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+    def reopen_if_missing(self):
+        """Reabre o arquivo se ele tiver sido removido desde a abertura."""
+        self.acquire()
+        try:
+            if self._fd is not None and not os.path.exists(self.baseFilename):
+                # O buffer pendente vai para o novo arquivo
+                os.close(self._fd)
+                self._open()
+        finally:
+            self.release()
+
+    def discard_buffer(self):
+        """Descarta os bytes pendentes sem gravá-los."""
+        self._buf.clear()
+
+    def _write(self):
+        buf = self._buf
+        while buf:
+            written = os.write(self._fd, buf)
+            del buf[:written]
+
+    def _should_rollover(self, size):
+        return (self.maxBytes > 0 and self.backupCount > 0
+                and self._size > 0 and self._size + size > self.maxBytes)
+
+    def _rollover(self):
+        """Grava o buffer, renomeia os backups e reabre o arquivo vazio."""
+        self._write()
+        os.close(self._fd)
+        self._fd = None
+        for i in range(self.backupCount - 1, 0, -1):
+            src = f'{self.baseFilename}.{i}'
+            dst = f'{self.baseFilename}.{i + 1}'
+            if os.path.exists(src):
+                if os.path.exists(dst):
+                    os.remove(dst)
+                os.rename(src, dst)
+        dst = f'{self.baseFilename}.1'
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(self.baseFilename, dst)
+        self._open()
+
+    def emit(self, record):
+        try:
+            if self._fd is None:
+                self._open()
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            if self._should_rollover(len(data)):
+                self._rollover()
+            self._buf += data
+            self._size += len(data)
+            if len(self._buf) > self.FLUSH_THRESHOLD or record.levelno >= logging.ERROR:
+                self._write()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._fd is not None and self._buf:
+                self._write()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            try:
+                if self._fd is not None:
+                    try:
+                        self._write()
+                    finally:
+                        os.close(self._fd)
+                        self._fd = None
+            finally:
+                super().close()
+        finally:
+            self.release()
+
+
+def _flush_handler(handler):
+    """Grava o buffer do handler e, no caso de um MemoryHandler, o do destino."""
+    handler.flush()
+    target = getattr(handler, 'target', None)
+    if target is not None:
+        target.flush()
+
+
 class RPALogger:
     """Gerenciador de logs para projetos RPA com rotação e formatação customizada."""
     
+    __slots__ = (
+        'name', 'log_dir', 'level', 'format_type', 'enable_file',
+        'enable_console', 'max_bytes', 'backup_count', 'buffer_capacity',
+        'logger', '_config', '_is_enabled_for', '_log', '_formatter',
+        '_raw_handlers', '_queue', '_queue_handler', '_listener',
+    )
+    
     # Formatos de log
     SIMPLE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     DETAILED_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(funcName)s() - %(message)s'
@@ -19,10 +268,30 @@ class RPALogger:
     DEFAULT_LOG_DIR = 'logs'
     DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
     DEFAULT_BACKUP_COUNT = 5
+    DEFAULT_BUFFER_CAPACITY = 512  # registros em memória antes de gravar no arquivo
+    
+    # Loggers com thread de escrita ativa, por nome
+    _ACTIVE = {}
+    
+    # Verdadeiro em processos filhos criados por fork: sem thread de escrita
+    # nem buffers, pois o filho pode ser encerrado sem aviso (Pool.terminate)
+    _WRITE_THROUGH = False
+    
+    # Formatters (por string de formato) e handlers de console (por formatter) compartilhados
+    _FORMATTER_CACHE = {}
+    _CONSOLE_HANDLERS = {}
+    
+    # Handlers de arquivo compartilhados, por (caminho absoluto, formatter)
+    _FILE_HANDLERS = {}
+    _FILE_HANDLERS_LOCK = threading.Lock()
+    
+    # Diretórios de log já criados neste processo
+    _ENSURED_DIRS = set()
     
     def __init__(self, name='RPA', log_dir=None, level=None, 
                  format_type='detailed', enable_file=True, enable_console=True,
-                 max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT):
+                 max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT,
+                 buffer_capacity=DEFAULT_BUFFER_CAPACITY):
         """
         Inicializa o gerenciador de logs RPA.
 
@@ -38,6 +307,9 @@ class RPALogger:
                            Padrão: 10 MB
             backup_count (int): Quantidade de arquivos de backup a manter. 
                               Padrão: 5
+            buffer_capacity (int): Registros acumulados em memória antes de
+                                 gravar no arquivo. Registros ERROR ou acima
+                                 gravam o buffer imediatamente. Padrão: 512
 
         Exemplo:
             >>> logger = RPALogger(name='MyBot')
@@ -52,69 +324,258 @@ class RPALogger:
         self.enable_console = enable_console
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        self.buffer_capacity = buffer_capacity or self.DEFAULT_BUFFER_CAPACITY
+        self._config = (
+            os.path.abspath(self.log_dir), self.level, self.format_type, enable_file,
+            enable_console, max_bytes, backup_count, self.buffer_capacity,
+        )
         
         # Criar logger
         self.logger = logging.getLogger(name)
+        
+        # Atalhos usados pelos métodos de log (evitam o dispatch de Logger.info etc.)
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._log = self.logger._log
+        
+        # Logger já configurado com os mesmos parâmetros: reaproveitar handlers
+        previous = RPALogger._ACTIVE.get(name)
+        if previous is not None and previous._config == self._config \
+                and previous._queue_handler in self.logger.handlers:
+            self._adopt(previous)
+            # set_level pode ter alterado o nível desde a configuração anterior
+            self.set_level(self.level)
+            return
+        
         self.logger.setLevel(self.level)
+        self._configure_find_caller()
+        
+        # Encerrar a thread de escrita de uma configuração anterior
+        if previous is not None:
+            previous.close()
         
-        # Evitar handlers duplicados
+        # Evitar handlers duplicados (gravando antes o que estiver em buffer)
         if self.logger.handlers:
+            for handler in self.logger.handlers:
+                _flush_handler(handler)
             self.logger.handlers.clear()
         
         # Configurar formato
         self._formatter = self._get_formatter()
         
+        # Handlers reais, executados pela thread do QueueListener
+        self._raw_handlers = []
+        self._queue = None
+        self._queue_handler = None
+        self._listener = None
+        
         # Adicionar handlers
         if enable_console:
             self._add_console_handler()
         
         if enable_file:
             self._add_file_handler()
+        
+        if RPALogger._WRITE_THROUGH:
+            self._attach_raw_handlers()
+        elif self._raw_handlers:
+            self._start_listener()
     
-    def _get_formatter(self):
-        """Retorna o formatter baseado no tipo configurado."""
+    @staticmethod
+    def tune_logging():
+        """
+        Desativa a coleta de thread/processo/task em cada LogRecord.
+
+        Nenhum formato do RPALogger usa esses campos, mas o ajuste vale para
+        todo o processo: handlers da aplicação que usem %(threadName)s ou
+        %(process)d passam a receber None. Use apenas quando nenhum outro
+        handler depender desses campos.
+
+        Exemplo:
+            >>> RPALogger.tune_logging()
+        """
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        if hasattr(logging, 'logAsyncioTasks'):  # Python 3.12+
+            logging.logAsyncioTasks = False
+    
+    def _configure_find_caller(self):
+        """
+        Evita a inspeção da pilha em cada registro quando o formato não a usa.
+
+        Se o formato não referencia arquivo, linha nem função de origem (caso
+        do formato simples), findCaller é trocado por uma versão que não
+        percorre os frames (exceto quando stack_info é solicitado).
+        """
+        # Remove a versão instalada por uma configuração anterior
+        vars(self.logger).pop('findCaller', None)
+        if _CALLER_FIELDS_RE.search(self._format_string()):
+            return
+        
+        find_caller = self.logger.findCaller
+        
+        def skip_find_caller(stack_info=False, stacklevel=1):
+            if stack_info:
+                # +1 para pular este frame, que não pertence ao módulo logging
+                return find_caller(stack_info, stacklevel + 1)
+            return '(unknown file)', 0, '(unknown function)', None
+        
+        self.logger.findCaller = skip_find_caller
+    
+    def _adopt(self, other):
+        """Compartilha o formatter, os handlers e a thread de escrita de outro RPALogger."""
+        self._formatter = other._formatter
+        self._raw_handlers = other._raw_handlers
+        self._queue = other._queue
+        self._queue_handler = other._queue_handler
+        self._listener = other._listener
+        
+        # O arquivo pode ter sido removido desde a configuração anterior
+        for handler in self._raw_handlers:
+            target = getattr(handler, 'target', None)
+            if isinstance(target, _BatchedAppendHandler):
+                target.reopen_if_missing()
+    
+    def _format_string(self):
+        """Retorna a string de formato do tipo configurado."""
         if self.format_type == 'simple':
-            format_str = self.SIMPLE_FORMAT
-        else:
-            format_str = self.DETAILED_FORMAT
+            return self.SIMPLE_FORMAT
+        return self.DETAILED_FORMAT
+    
+    def _get_formatter(self):
+        """Retorna o formatter do formato configurado (um por string de formato)."""
+        format_str = self._format_string()
         
-        return logging.Formatter(
-            format_str,
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        formatter = RPALogger._FORMATTER_CACHE.get(format_str)
+        if formatter is None:
+            formatter = RPALogger._FORMATTER_CACHE.setdefault(
+                format_str,
+                _FastFormatter(format_str, datefmt='%Y-%m-%d %H:%M:%S')
+            )
+        return formatter
     
     def _ensure_log_dir(self):
-        """Cria o diretório de logs se não existir."""
-        Path(self.log_dir).mkdir(parents=True, exist_ok=True)
+        """Cria o diretório de logs se não existir (uma vez por diretório)."""
+        log_dir = os.path.abspath(self.log_dir)
+        if log_dir in RPALogger._ENSURED_DIRS:
+            return
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        RPALogger._ENSURED_DIRS.add(log_dir)
     
     def _add_console_handler(self):
-        """Adiciona handler para exibição no console."""
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self.level)
-        console_handler.setFormatter(self._formatter)
-        self.logger.addHandler(console_handler)
+        """
+        Adiciona handler para exibição no console.
+
+        O handler é compartilhado por todos os loggers com o mesmo formato e
+        não tem nível próprio: a filtragem fica a cargo de cada logger.
+        """
+        console_handler = RPALogger._CONSOLE_HANDLERS.get(self._formatter)
+        if console_handler is None:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(self._formatter)
+            RPALogger._CONSOLE_HANDLERS[self._formatter] = console_handler
+        
+        if console_handler not in self._raw_handlers:
+            self._raw_handlers.append(console_handler)
     
     def _add_file_handler(self):
-        """Adiciona handler com rotação de arquivos."""
+        """
+        Adiciona handler com rotação de arquivos.
+
+        O handler de arquivo fica atrás de um MemoryHandler, que acumula
+        registros e os grava em lote, evitando uma escrita por log. Loggers
+        que gravam no mesmo arquivo com o mesmo formato reutilizam o mesmo
+        handler de arquivo.
+        """
         self._ensure_log_dir()
         
-        # Nome do arquivo com timestamp
-        timestamp = datetime.now().strftime('%Y%m%d')
+        # Nome do arquivo com a data do início do processo
         log_file = os.path.join(
             self.log_dir,
-            f'{self.name.lower()}_{timestamp}.log'
+            f'{self.name.lower()}_{_DATE_STAMP}.log'
         )
         
-        # Handler com rotação por tamanho
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=self.max_bytes,
-            backupCount=self.backup_count,
-            encoding='utf-8'
+        # Handler com rotação por tamanho e escrita em lote, um por arquivo e
+        # formato: loggers que gravam no mesmo arquivo com o mesmo formato
+        # compartilham descritor e contador, sem alterar o formato dos demais
+        key = (os.path.abspath(log_file), self._formatter)
+        with RPALogger._FILE_HANDLERS_LOCK:
+            file_handler = RPALogger._FILE_HANDLERS.get(key)
+            if file_handler is None:
+                file_handler = _BatchedAppendHandler(
+                    log_file,
+                    maxBytes=self.max_bytes,
+                    backupCount=self.backup_count,
+                    encoding='utf-8'
+                )
+                file_handler.setFormatter(self._formatter)
+                RPALogger._FILE_HANDLERS[key] = file_handler
+            else:
+                file_handler.reopen_if_missing()
+                file_handler.maxBytes = self.max_bytes
+                file_handler.backupCount = self.backup_count
+            if RPALogger._WRITE_THROUGH:
+                file_handler.FLUSH_THRESHOLD = 0
+        
+        # Buffer em memória; o nível é filtrado aqui, antes do arquivo
+        buffer_handler = logging.handlers.MemoryHandler(
+            capacity=1 if RPALogger._WRITE_THROUGH else self.buffer_capacity,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
         )
-        file_handler.setLevel(self.level)
-        file_handler.setFormatter(self._formatter)
-        self.logger.addHandler(file_handler)
+        buffer_handler.setLevel(self.level)
+        self._raw_handlers.append(buffer_handler)
+    
+    def _start_listener(self):
+        """
+        Conecta o logger aos handlers através de uma fila.
+
+        Quem chama o log apenas enfileira o registro; a escrita no console e
+        no arquivo acontece na thread do QueueListener.
+        """
+        self._queue = queue.Queue()
+        self._queue_handler = logging.handlers.QueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        
+        self._listener = logging.handlers.QueueListener(
+            self._queue,
+            *self._raw_handlers,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        RPALogger._ACTIVE[self.name] = self
+    
+    def close(self):
+        """
+        Encerra a thread de escrita, gravando os registros pendentes.
+
+        Depois de fechado, o logger passa a escrever diretamente nos handlers.
+        Chamado automaticamente ao fim do processo.
+
+        Exemplo:
+            >>> logger.close()
+        """
+        # A thread pode ser compartilhada: só encerra se ainda estiver ativa
+        if not self._listener_active():
+            return
+        
+        del RPALogger._ACTIVE[self.name]
+        self._listener.stop()
+        self._attach_raw_handlers()
+    
+    def _listener_active(self):
+        """Indica se a thread de escrita deste logger ainda está em uso."""
+        active = RPALogger._ACTIVE.get(self.name)
+        return self._listener is not None and active is not None \
+            and active._listener is self._listener
+    
+    def _attach_raw_handlers(self):
+        """Troca a fila pelos handlers reais, gravando o que estiver em buffer."""
+        self.logger.removeHandler(self._queue_handler)
+        for handler in self._raw_handlers:
+            _flush_handler(handler)
+            self.logger.addHandler(handler)
     
     def set_level(self, level):
         """
@@ -127,32 +588,81 @@ class RPALogger:
             >>> logger.set_level(logging.DEBUG)
         """
         self.logger.setLevel(level)
-        for handler in self.logger.handlers:
-            handler.setLevel(level)
+        shared = RPALogger._CONSOLE_HANDLERS.values()
+        for handler in self._raw_handlers:
+            if handler not in shared:
+                handler.setLevel(level)
+    
+    def flush(self):
+        """
+        Grava imediatamente os registros mantidos em buffer.
+
+        Aguarda a thread de escrita esvaziar a fila antes de gravar os buffers.
+        Os buffers também são gravados ao fim do processo (logging.shutdown).
+
+        Exemplo:
+            >>> logger.flush()
+        """
+        if self._listener_active():
+            self._queue.join()
+        
+        for handler in self._raw_handlers:
+            _flush_handler(handler)
     
     def debug(self, message, *args, **kwargs):
         """Log de nível DEBUG."""
-        self.logger.debug(message, *args, **kwargs)
+        if self._is_enabled_for(DEBUG):
+            if kwargs:
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(DEBUG, message, args, **kwargs)
+            else:
+                self._log(DEBUG, message, args, None, None, False, _STACKLEVEL)
     
     def info(self, message, *args, **kwargs):
         """Log de nível INFO."""
-        self.logger.info(message, *args, **kwargs)
+        if self._is_enabled_for(INFO):
+            if kwargs:
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(INFO, message, args, **kwargs)
+            else:
+                self._log(INFO, message, args, None, None, False, _STACKLEVEL)
     
     def warning(self, message, *args, **kwargs):
         """Log de nível WARNING."""
-        self.logger.warning(message, *args, **kwargs)
+        if self._is_enabled_for(WARNING):
+            if kwargs:
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(WARNING, message, args, **kwargs)
+            else:
+                self._log(WARNING, message, args, None, None, False, _STACKLEVEL)
     
     def error(self, message, *args, **kwargs):
         """Log de nível ERROR."""
-        self.logger.error(message, *args, **kwargs)
+        if self._is_enabled_for(ERROR):
+            if kwargs:
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(ERROR, message, args, **kwargs)
+            else:
+                self._log(ERROR, message, args, None, None, False, _STACKLEVEL)
     
     def critical(self, message, *args, **kwargs):
         """Log de nível CRITICAL."""
-        self.logger.critical(message, *args, **kwargs)
+        if self._is_enabled_for(CRITICAL):
+            if kwargs:
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(CRITICAL, message, args, **kwargs)
+            else:
+                self._log(CRITICAL, message, args, None, None, False, _STACKLEVEL)
     
     def exception(self, message, *args, **kwargs):
         """Log de exceção com traceback."""
-        self.logger.exception(message, *args, **kwargs)
+        if self._is_enabled_for(ERROR):
+            if kwargs:
+                kwargs.setdefault('exc_info', True)
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL - 1
+                self._log(ERROR, message, args, **kwargs)
+            else:
+                self._log(ERROR, message, args, True, None, False, _STACKLEVEL)
     
     def get_logger(self):
         """
@@ -169,12 +679,13 @@ class RPALogger:
 class LoggerFactory:
     """Factory para criar loggers pré-configurados para diferentes contextos."""
     
-    _loggers = {}
-    
     @staticmethod
     def get_logger(name='RPA', context=None, **kwargs):
         """
-        Obtém ou cria um logger com cache.
+        Obtém ou cria um logger.
+
+        Chamadas com o mesmo nome e configuração reutilizam os handlers já
+        criados, independentemente do contexto.
 
         Args:
             name (str): Nome do logger
@@ -188,17 +699,16 @@ class LoggerFactory:
             >>> logger = LoggerFactory.get_logger('MyBot', context='browser')
             >>> logger.info('Abrindo navegador')
         """
-        logger_key = f"{name}_{context}" if context else name
-        
-        if logger_key not in LoggerFactory._loggers:
-            LoggerFactory._loggers[logger_key] = RPALogger(name, **kwargs)
-        
-        return LoggerFactory._loggers[logger_key]
+        return RPALogger(name, **kwargs)
     
     @staticmethod
     def clear_cache():
-        """Limpa o cache de loggers."""
-        LoggerFactory._loggers.clear()
+        """
+        Encerra os loggers ativos.
+
+        A próxima chamada a get_logger recria os handlers do zero.
+        """
+        _close_active_loggers()
 
 
 # Função helper para uso rápido
@@ -218,3 +728,59 @@ def get_rpa_logger(name='RPA', **kwargs):
         >>> logger.info('Iniciando')
     """
     return RPALogger(name, **kwargs)
+
+
+def _close_active_loggers():
+    """Encerra as threads de escrita ativas ao fim do processo."""
+    for rpa_logger in list(RPALogger._ACTIVE.values()):
+        rpa_logger.close()
+
+
+def _reset_after_fork():
+    """
+    Ajusta os loggers no processo filho após um fork.
+
+    A thread do QueueListener não existe no filho, então os registros
+    ficariam parados na fila. Os buffers herdados são descartados (o pai
+    os grava) e os loggers passam a escrever diretamente nos handlers, sem
+    acumular registros: um filho encerrado com SIGTERM (Pool.terminate) não
+    passa por nenhum finalizador.
+    """
+    RPALogger._WRITE_THROUGH = True
+    RPALogger._FILE_HANDLERS_LOCK = threading.Lock()
+    for file_handler in RPALogger._FILE_HANDLERS.values():
+        file_handler.discard_buffer()
+        file_handler.FLUSH_THRESHOLD = 0
+    
+    active = list(RPALogger._ACTIVE.values())
+    RPALogger._ACTIVE.clear()
+    for rpa_logger in active:
+        for handler in rpa_logger._raw_handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.buffer.clear()
+                handler.capacity = 1
+        rpa_logger._attach_raw_handlers()
+    
+    # multiprocessing encerra o filho com os._exit, sem passar pelo atexit:
+    # agendar a gravação dos buffers nos finalizadores do processo filho
+    mp_util = sys.modules.get('multiprocessing.util')
+    if mp_util is not None:
+        mp_util.register_after_fork(RPALogger, _register_child_shutdown)
+
+
+def _register_child_shutdown(_):
+    """Registra o encerramento dos logs entre os finalizadores do multiprocessing."""
+    sys.modules['multiprocessing.util'].Finalize(None, _shutdown_child, exitpriority=0)
+
+
+def _shutdown_child():
+    """Grava os registros pendentes ao fim de um processo filho."""
+    _close_active_loggers()
+    logging.shutdown()
+
+
+# Registrado após o atexit do módulo logging, portanto executado antes dele
+atexit.register(_close_active_loggers)
+
+if hasattr(os, 'register_at_fork'):  # indisponível no Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
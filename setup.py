@@ -12,6 +12,10 @@ setup(
         'selenium>=4.0.0',
         'webdriver-manager>=3.8.0',
     ],
+    extras_require={
+        'cdp': ['websocket-client>=1.0.0'],
+        'test': ['pytest>=7.0'],
+    },
     python_requires='>=3.8',
     classifiers=[
         'Development Status :: 3 - Alpha',
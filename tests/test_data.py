@@ -0,0 +1,96 @@
+"""Testes do merge de DataFrames do DataHandler."""
+
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rpa_core_lib.data import DataHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return DataHandler(output_dir=str(tmp_path))
+
+
+def _sequential_merge(df_list, on):
+    return reduce(lambda left, right: pd.merge(left, right, how='inner', on=on), df_list)
+
+
+def _normalize(df):
+    # O caminho rápido pode alterar a ordem das linhas, não o conteúdo
+    return df.sort_values(list(df.columns), na_position='first').reset_index(drop=True)
+
+
+def _assert_same_merge(handler, df_list, on):
+    expected = _sequential_merge(df_list, on)
+    result = handler.merge_dataframes(df_list, how='inner', on=on)
+    
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(_normalize(result), _normalize(expected))
+
+
+def test_merge_chave_unica(handler):
+    df_list = [
+        pd.DataFrame({'id': [3, 1, 2, 4], 'a': [30, 10, 20, 40]}),
+        pd.DataFrame({'id': [1, 2, 3, 5], 'b': ['x', 'y', 'z', 'w']}),
+        pd.DataFrame({'id': [2, 3, 1], 'c': [2.0, 3.0, 1.0]}),
+    ]
+    _assert_same_merge(handler, df_list, 'id')
+
+
+def test_merge_multiplas_chaves(handler):
+    df_list = [
+        pd.DataFrame({'k1': [1, 1, 2, 2], 'k2': ['a', 'b', 'a', 'b'], 'v': [1, 2, 3, 4]}),
+        pd.DataFrame({'k1': [2, 1, 1], 'k2': ['b', 'a', 'c'], 'w': [5, 6, 7]}),
+    ]
+    _assert_same_merge(handler, df_list, ['k1', 'k2'])
+
+
+def test_merge_chaves_duplicadas(handler):
+    df_list = [
+        pd.DataFrame({'id': [1, 1, 2, 3], 'a': [1, 2, 3, 4]}),
+        pd.DataFrame({'id': [1, 2, 2], 'b': [5, 6, 7]}),
+        pd.DataFrame({'id': [1, 2], 'c': [8, 9]}),
+    ]
+    _assert_same_merge(handler, df_list, 'id')
+
+
+def test_merge_chaves_nan(handler):
+    df_list = [
+        pd.DataFrame({'id': [1.0, np.nan, 2.0], 'a': [1, 2, 3]}),
+        pd.DataFrame({'id': [np.nan, 2.0, 3.0], 'b': [4, 5, 6]}),
+    ]
+    _assert_same_merge(handler, df_list, 'id')
+
+
+def test_merge_chaves_nan_duplicadas(handler):
+    df_list = [
+        pd.DataFrame({'id': [np.nan, np.nan, 1.0], 'a': [1, 2, 3]}),
+        pd.DataFrame({'id': [np.nan, 1.0], 'b': [4, 5]}),
+    ]
+    _assert_same_merge(handler, df_list, 'id')
+
+
+def test_merge_colunas_repetidas_usa_merge_sequencial(handler):
+    df_list = [
+        pd.DataFrame({'id': [1, 2], 'v': [1, 2]}),
+        pd.DataFrame({'id': [2, 1], 'v': [3, 4]}),
+    ]
+    result = handler.merge_dataframes(df_list, how='inner', on='id')
+    
+    pd.testing.assert_frame_equal(result, _sequential_merge(df_list, 'id'))
+
+
+@pytest.mark.parametrize('transform', [
+    lambda handler, df: handler.clean_columns(df),
+    lambda handler, df: handler.fill_missing(df, method=None),
+])
+def test_resultado_independente_da_entrada(handler, transform):
+    df = pd.DataFrame({'Valor Total': [1.0, 2.0]})
+    
+    result = transform(handler, df)
+    result.iloc[0, 0] = 99.0
+    
+    assert df.iloc[0, 0] == 1.0
@@ -0,0 +1,326 @@
+"""Testes do handler de arquivo, do formatter compilado e da origem dos registros do RPALogger."""
+
+import io
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+import traceback
+
+import pytest
+
+from rpa_core_lib import logger as logger_module
+from rpa_core_lib.logger import (
+    RPALogger,
+    _BatchedAppendHandler,
+    _compile_format,
+    _FastFormatter,
+)
+
+
+def _record(message, level=logging.INFO, args=(), exc_info=None):
+    return logging.LogRecord('teste', level, '/projeto/bot.py', 42, message,
+                             args, exc_info, func='executar')
+
+
+def _handler(path, **kwargs):
+    handler = _BatchedAppendHandler(str(path), **kwargs)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    return handler
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+# ==================== ROTAÇÃO ====================
+
+def test_rotacao_renomeia_backups_em_ordem(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    handler = _handler(log_file, maxBytes=100, backupCount=2)
+    
+    # 40 bytes por linha: duas linhas por arquivo
+    for i in range(10):
+        handler.handle(_record(f'{i}' + 'x' * 38))
+    handler.close()
+    
+    assert sorted(os.listdir(tmp_path)) == ['bot.log', 'bot.log.1', 'bot.log.2']
+    assert _read(log_file).splitlines() == ['8' + 'x' * 38, '9' + 'x' * 38]
+    assert _read(f'{log_file}.1').splitlines()[0].startswith('6')
+    assert _read(f'{log_file}.2').splitlines()[0].startswith('4')
+    for name in os.listdir(tmp_path):
+        assert os.path.getsize(tmp_path / name) <= 100
+
+
+def test_sem_backup_count_nao_rotaciona(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    handler = _handler(log_file, maxBytes=100, backupCount=0)
+    
+    for i in range(10):
+        handler.handle(_record('x' * 39))
+    handler.close()
+    
+    assert os.listdir(tmp_path) == ['bot.log']
+    assert os.path.getsize(log_file) == 400
+
+
+def test_contador_considera_arquivo_existente(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    log_file.write_bytes(b'y' * 90)
+    handler = _handler(log_file, maxBytes=100, backupCount=1)
+    
+    handler.handle(_record('x' * 19))
+    handler.close()
+    
+    assert _read(f'{log_file}.1') == 'y' * 90
+    assert _read(log_file) == 'x' * 19 + '\n'
+
+
+# ==================== GRAVAÇÃO EM LOTE ====================
+
+def test_info_fica_em_buffer_ate_error(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    handler = _handler(log_file)
+    
+    handler.handle(_record('info'))
+    assert os.path.getsize(log_file) == 0
+    
+    handler.handle(_record('erro', level=logging.ERROR))
+    assert _read(log_file) == 'info\nerro\n'
+    handler.close()
+
+
+def test_buffer_grava_ao_passar_do_limite(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    handler = _handler(log_file)
+    line = 'x' * 1023  # 1 KiB com a quebra de linha
+    
+    for _ in range(handler.FLUSH_THRESHOLD // 1024):
+        handler.handle(_record(line))
+    assert os.path.getsize(log_file) == 0
+    
+    handler.handle(_record(line))
+    assert os.path.getsize(log_file) == handler.FLUSH_THRESHOLD + 1024
+    handler.close()
+
+
+def test_flush_e_close_gravam_o_buffer(tmp_path):
+    log_file = tmp_path / 'bot.log'
+    handler = _handler(log_file)
+    
+    handler.handle(_record('um'))
+    handler.flush()
+    assert _read(log_file) == 'um\n'
+    
+    handler.handle(_record('dois'))
+    handler.close()
+    assert _read(log_file) == 'um\ndois\n'
+
+
+# ==================== FORMATTER COMPILADO ====================
+
+@pytest.mark.parametrize('fmt', [RPALogger.SIMPLE_FORMAT, RPALogger.DETAILED_FORMAT])
+def test_compile_format_igual_ao_percent_style(fmt):
+    record = _record('valor %s {chave} 100%%', args=('a',))
+    record.message = record.getMessage()
+    record.asctime = '2024-01-01 12:00:00'
+    
+    assert _compile_format(fmt)(record) == logging.PercentStyle(fmt).format(record)
+
+
+@pytest.mark.parametrize('fmt', ['%(levelname)-8s %(message)s', '%(msecs)03d', '%(message)r',
+                                 '%(class)s %(message)s'])
+def test_compile_format_recusa_especificacoes_nao_suportadas(fmt):
+    assert _compile_format(fmt) is None
+
+
+@pytest.mark.parametrize('fmt', [RPALogger.SIMPLE_FORMAT, RPALogger.DETAILED_FORMAT,
+                                 '%(levelname)-8s %(message)s', '%(class)s %(message)s'])
+def test_fast_formatter_igual_ao_formatter_padrao(fmt):
+    try:
+        raise ValueError('falha')
+    except ValueError:
+        exc_info = sys.exc_info()
+    
+    datefmt = '%Y-%m-%d %H:%M:%S'
+    record = _record('erro %d', level=logging.ERROR, args=(1,), exc_info=exc_info)
+    setattr(record, 'class', 'Bot')  # campo extra com nome reservado
+    
+    actual = _FastFormatter(fmt, datefmt=datefmt).format(record)
+    assert actual == logging.Formatter(fmt, datefmt=datefmt).format(record)
+
+
+def test_registro_formatado_continua_serializavel():
+    formatter = _FastFormatter(RPALogger.SIMPLE_FORMAT)
+    record = _record('mensagem')
+    text = formatter.format(record)
+    
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored.getMessage() == 'mensagem'
+    assert formatter.format(record) == text
+
+
+# ==================== ORIGEM DO REGISTRO ====================
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _find_caller_py310(self, stack_info=False, stacklevel=1):
+    """Reprodução do Logger.findCaller do CPython 3.8-3.10."""
+    f = _current_frame_py310()
+    if f is not None:
+        f = f.f_back
+    orig_f = f
+    while f and stacklevel > 1:
+        f = f.f_back
+        stacklevel -= 1
+    if not f:
+        f = orig_f
+    rv = '(unknown file)', 0, '(unknown function)', None
+    while hasattr(f, 'f_code'):
+        co = f.f_code
+        if os.path.normcase(co.co_filename) == logging._srcfile:
+            f = f.f_back
+            continue
+        sinfo = None
+        if stack_info:
+            sio = io.StringIO()
+            sio.write('Stack (most recent call last):\n')
+            traceback.print_stack(f, file=sio)
+            sinfo = sio.getvalue().rstrip('\n')
+        rv = (co.co_filename, f.f_lineno, co.co_name, sinfo)
+        break
+    return rv
+
+
+_current_frame_py310 = lambda: sys._getframe(3)  # noqa: E731 (igual ao logging do 3.10)
+
+
+@pytest.fixture(params=['nativo', 'py310'])
+def capture_logger(request, monkeypatch):
+    if request.param == 'py310':
+        monkeypatch.setattr(logger_module, '_STACKLEVEL', 1)
+        monkeypatch.setattr(logging.Logger, 'findCaller', _find_caller_py310)
+    
+    def build(format_type='detailed'):
+        rpa_logger = RPALogger(f'captura_{format_type}_{request.param}',
+                               format_type=format_type, level=logging.DEBUG,
+                               enable_file=False, enable_console=False)
+        capture = _Capture()
+        rpa_logger.logger.addHandler(capture)
+        rpa_logger.logger.propagate = False
+        return rpa_logger, capture.records
+    return build
+
+
+def _log_from_helper(rpa_logger):
+    rpa_logger.info('via helper', stacklevel=2)
+
+
+def test_origem_aponta_para_quem_chamou(capture_logger):
+    rpa_logger, records = capture_logger()
+    
+    line = sys._getframe().f_lineno + 1
+    rpa_logger.info('simples')
+    rpa_logger.warning('com kwargs %s', 1, extra={'chave': 'valor'})
+    try:
+        raise ValueError('falha')
+    except ValueError:
+        rpa_logger.exception('excecao')
+    _log_from_helper(rpa_logger)
+    
+    lines = [line, line + 1, line + 5, line + 6]
+    for record, expected_line in zip(records, lines):
+        assert record.filename == os.path.basename(__file__)
+        assert record.funcName == 'test_origem_aponta_para_quem_chamou'
+        assert record.lineno == expected_line
+    assert len(records) == 4
+
+
+def test_formato_simples_mantem_stack_info_do_chamador(capture_logger):
+    rpa_logger, records = capture_logger('simple')
+    
+    line = sys._getframe().f_lineno + 1
+    rpa_logger.info('com pilha', stack_info=True)
+    rpa_logger.info('sem pilha')
+    
+    with_stack, without_stack = records
+    last_frame = with_stack.stack_info.splitlines()[-2]
+    assert f'line {line}, in test_formato_simples_mantem_stack_info_do_chamador' in last_frame
+    assert without_stack.lineno == 0
+
+
+# ==================== REUTILIZAÇÃO ====================
+
+def test_reutilizacao_restaura_o_nivel_configurado(tmp_path):
+    first = RPALogger('nivel_reuso', log_dir=str(tmp_path), enable_console=False)
+    first.set_level(logging.WARNING)
+    
+    second = RPALogger('nivel_reuso', log_dir=str(tmp_path), enable_console=False)
+    second.info('registrado')
+    second.flush()
+    
+    assert second.logger.level == logging.INFO
+    assert all(handler.level == logging.INFO for handler in second._raw_handlers)
+    log_file, = tmp_path.iterdir()
+    assert 'registrado' in _read(log_file)
+    second.close()
+
+
+def test_formatos_diferentes_no_mesmo_arquivo(tmp_path):
+    simple = RPALogger('formato_misto', log_dir=str(tmp_path), enable_console=False,
+                       format_type='simple')
+    detailed = RPALogger('FORMATO_MISTO', log_dir=str(tmp_path), enable_console=False)
+    
+    simple.info('linha simples')
+    detailed.info('linha detalhada')
+    simple.flush()
+    detailed.flush()
+    
+    log_file, = tmp_path.iterdir()
+    lines = _read(log_file).splitlines()
+    assert lines[0].endswith(' - formato_misto - INFO - linha simples')
+    assert '[test_logger.py:' in lines[1] and lines[1].endswith(' - linha detalhada')
+    simple.close()
+    detailed.close()
+
+
+# ==================== PROCESSOS FILHOS ====================
+
+_POOL_LOGGER = None
+_POOL_STARTED = None
+
+
+def _log_and_block(index):
+    _POOL_LOGGER.info(f'tarefa {index}')
+    _POOL_STARTED.put(index)
+    time.sleep(60)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requer fork')
+def test_filho_do_pool_grava_antes_do_terminate(tmp_path):
+    global _POOL_LOGGER, _POOL_STARTED
+    context = multiprocessing.get_context('fork')
+    _POOL_LOGGER = RPALogger('pool_filho', log_dir=str(tmp_path), enable_console=False)
+    _POOL_STARTED = context.Queue()
+    
+    # Os filhos ficam ocupados até o terminate(), que os encerra sem finalizadores
+    with context.Pool(2) as pool:
+        for index in range(2):
+            pool.apply_async(_log_and_block, (index,))
+        for _ in range(2):
+            _POOL_STARTED.get(timeout=10)
+    
+    _POOL_LOGGER.close()
+    log_file, = tmp_path.iterdir()
+    content = _read(log_file)
+    assert 'tarefa 0\n' in content and 'tarefa 1\n' in content